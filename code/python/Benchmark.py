@@ -3,7 +3,8 @@ Matrix multiplication benchmarking harness for Python implementation.
 
 This module benchmarks the performance of matrix multiplication across
 multiple matrix sizes and runs, recording execution time, CPU usage, and
-memory consumption to a CSV file.
+memory consumption to a CSV file. CPU and memory are only sampled for
+sizes of at least METRICS_MIN_SIZE; smaller runs record NaN for both.
 
 Command-line arguments:
     --sizes: Space-separated matrix sizes (default: 64 128 256 512 1024)
@@ -11,85 +12,249 @@ Command-line arguments:
     --out: Output CSV file path (default: "results_raw.csv")
     --seed: Random seed (default: 27)
     --check_n: Matrix size for correctness check (default: 5)
+    --impl: Implementations to benchmark: naive, blas, numba, blocked, plus cy
+        and avx2 when their extensions are built (default: all available)
+    --block: Tile size BM = BN = BK for the blocked implementation (default: 64)
+    --parallel: Spread the runs of each size across a process pool (flag)
 
 Example:
     python benchmark.py --sizes 64 128 256 --runs 5 --out output.csv --seed 42
 """
 
 import argparse
+import contextlib
+import csv
+import functools
+import gc
+import math
+import multiprocessing
 import os
 import time
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 import psutil
 
-from matrix_mult import matrixMultiplication
+from matrix_mult import (
+    HAVE_AVX2,
+    MR,
+    NR,
+    matrixMultiplication,
+    matmul_avx2,
+    matmul_blocked,
+    matmul_numba,
+    matmul_numpy,
+)
+
+# Optional Cython extension, built with `python setup.py build_ext --inplace`
+try:
+    from matrix_mult_c import matmul as matmul_cython
+except ImportError:
+    matmul_cython = None
 
 # CSV header format
 HEADER = "run_id;language;size;run_idx;time_ms;cpu_pct;peak_mib\n"
 
+# Below this size psutil sampling costs more than the multiplication,
+# so CPU and memory are not collected (recorded as NaN)
+METRICS_MIN_SIZE = 128
+
+# Available implementations: CLI name -> (CSV language label, function)
+IMPLEMENTATIONS = {
+    "naive": ("Python-naive", matrixMultiplication),
+    "blas": ("Python-BLAS", matmul_numpy),
+    "numba": ("Python-numba", matmul_numba),
+    "blocked": ("Python-blocked", matmul_blocked),
+}
+if matmul_cython is not None:
+    IMPLEMENTATIONS["cy"] = ("Python-cy", matmul_cython)
+if HAVE_AVX2:
+    IMPLEMENTATIONS["avx2"] = ("Python-avx2", matmul_avx2)
+
 
-def check_correctness(n: int, seed: int = 27, atol: float = 1e-8) -> bool:
+def check_correctness(
+    n: int, 
+    seed: int = 27, 
+    rtol: float = 1e-5, 
+    atol: float = 1e-5, 
+    matmul: Callable[..., np.ndarray] = matrixMultiplication
+) -> bool:
     """
     Verify correctness of matrix multiplication implementation.
     
-    Tests the multiplication with an n×n matrix and compares the result
-    against NumPy's built-in matrix multiplication.
+    Tests the multiplication with an n×n float32 matrix, the same precision
+    the benchmark uses, and compares the result against NumPy's built-in
+    matrix multiplication.
     
     Args:
         n: Dimension of the square matrix
         seed: Random seed for reproducibility
+        rtol: Relative tolerance for element-wise comparison
         atol: Absolute tolerance for element-wise comparison
+        matmul: Matrix multiplication function under test
     
     Returns:
         True if implementation is correct, False otherwise
     """
     rng = np.random.default_rng(seed)
-    A = rng.random((n, n), dtype=np.float64)
-    B = rng.random((n, n), dtype=np.float64)
+    A = rng.random((n, n), dtype=np.float32)
+    B = rng.random((n, n), dtype=np.float32)
     
     # Compare custom implementation against NumPy's optimized version
-    return np.allclose(A @ B, matrixMultiplication(A, B), atol=atol)
+    return np.allclose(A @ B, matmul(A, B), rtol=rtol, atol=atol)
+
+
+def blocked_check_size(block: int) -> int:
+    """
+    Pick a correctness-check size that exercises the blocked kernel fully.
+    
+    The default check_n fits inside a single partial tile, so packing
+    offsets and full micro-tiles would go untested. The returned size spans
+    several tiles of `block` and is not a multiple of MR or NR, so the check
+    covers multiple blocks and k slabs, full MR×NR micro-tiles and ragged
+    edges.
+    
+    Args:
+        block: Tile size (BM = BN = BK) used by the blocked implementation
+    
+    Returns:
+        Matrix size larger than 2 * block with n % MR != 0 and n % NR != 0
+    
+    Examples:
+        >>> blocked_check_size(64)
+        129
+    """
+    n = 2 * block + 1
+    while n % MR == 0 or n % NR == 0:
+        n += 1
+    return n
 
 
 def one_run(
     A: np.ndarray, 
     B: np.ndarray, 
     proc: psutil.Process, 
-    ncpu: int
+    ncpu: int,
+    matmul: Callable[..., np.ndarray] = matrixMultiplication,
+    collect_metrics: bool = True,
+    out: Optional[np.ndarray] = None
 ) -> Tuple[float, float, float]:
     """
     Execute a single matrix multiplication run and collect metrics.
     
+    The garbage collector is disabled for the duration of the run so a
+    collection cannot land inside the timed window.
+    
     Args:
         A: First input matrix (n×n)
         B: Second input matrix (n×n)
         proc: psutil Process object for the current process
         ncpu: Number of logical CPU cores
+        matmul: Matrix multiplication function to time
+        collect_metrics: Whether to sample process CPU time and memory usage.
+            For tiny matrices the psutil calls cost more than the
+            multiplication itself, so callers may turn them off.
+        out: Optional preallocated output buffer (n×n) reused across runs,
+            so the run measures compute rather than allocation
     
     Returns:
-        Tuple of (execution_time_ms, cpu_percentage, peak_memory_mib)
+        Tuple of (execution_time_ms, cpu_percentage, peak_memory_mib);
+        CPU and memory are NaN when collect_metrics is False
+    """
+    # Keep the garbage collector from pausing inside the measured window
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if not collect_metrics:
+            t0 = time.perf_counter_ns()
+            matmul(A, B, out=out)
+            t1 = time.perf_counter_ns()
+            return (t1 - t0) / 1e6, math.nan, math.nan
+        
+        # Bind accessors once so attribute lookups stay off the timed path.
+        # Process CPU time comes from process_time_ns (all threads, ns
+        # resolution): psutil's cpu_times only advances once per clock tick
+        # (~10 ms), which is longer than the fast implementations take.
+        _mem = proc.memory_info
+        _cpu = time.process_time_ns
+        
+        # Capture metrics before execution (CPU time last, right before the clock)
+        mem_before = _mem().rss / (1024 * 1024)  # Convert bytes to MiB
+        cpu_before = _cpu()
+        t0 = time.perf_counter_ns()
+        
+        # Execute matrix multiplication
+        matmul(A, B, out=out)
+        
+        # Capture metrics after execution
+        t1 = time.perf_counter_ns()
+        cpu_after = _cpu()
+        mem_after = _mem().rss / (1024 * 1024)  # Convert bytes to MiB
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    # Calculate performance metrics
+    # (integer nanoseconds: exact subtraction, no float cancellation)
+    wall_ns = t1 - t0
+    wall_ms = wall_ns / 1e6
+    cpu_ns = cpu_after - cpu_before
+    cpu_pct = 100.0 * cpu_ns / (wall_ns * ncpu)
+    
+    return wall_ms, cpu_pct, max(mem_before, mem_after)
+
+
+def warm_up(matmuls: List[Callable[..., np.ndarray]]) -> None:
+    """
+    Call each implementation once on a tiny float32 input.
+    
+    Triggers JIT compilation (or loads it from Numba's on-disk cache) so
+    that compile time is excluded from the timed runs. Used as the process
+    pool initializer.
+    
+    Args:
+        matmuls: Matrix multiplication functions to warm up
     """
-    # Capture metrics before execution
-    mem_before = proc.memory_info().rss / (1024 * 1024)  # Convert bytes to MiB
-    cpu_before = proc.cpu_times()
-    t0 = time.perf_counter()
+    warm = np.ones((2, 2), dtype=np.float32)
+    for matmul in matmuls:
+        matmul(warm, warm)
+
+
+def pool_run(
+    matmul: Callable[..., np.ndarray],
+    n: int,
+    seed: int,
+    collect_metrics: bool = True
+) -> Tuple[float, float, float]:
+    """
+    Execute a single run inside a worker process of the process pool.
     
-    # Execute matrix multiplication
-    matrixMultiplication(A, B)
+    The worker generates its own n×n float32 inputs from (seed, n), so only
+    the seed crosses the process boundary instead of the matrices.
     
-    # Capture metrics after execution
-    t1 = time.perf_counter()
-    cpu_after = proc.cpu_times()
-    mem_after = proc.memory_info().rss / (1024 * 1024)  # Convert bytes to MiB
+    Runs execute concurrently, so CPU percentage and memory are those of a
+    loaded machine and of the worker process rather than of an isolated
+    run. This mode suits timing surveys of single-threaded implementations
+    only; multi-threaded kernels (Numba, BLAS) will compete for cores.
     
-    # Calculate performance metrics
-    wall = max(t1 - t0, 1e-12)  # Avoid division by zero
-    cpu_used = (cpu_after.user - cpu_before.user) + (cpu_after.system - cpu_before.system)
-    cpu_pct = 100.0 * cpu_used / (wall * ncpu)
+    Args:
+        matmul: Matrix multiplication function to time
+        n: Dimension of the square matrices
+        seed: Random seed for the inputs
+        collect_metrics: Whether to sample CPU and memory usage with psutil
     
-    return wall * 1000.0, cpu_pct, max(mem_before, mem_after)
+    Returns:
+        Tuple of (execution_time_ms, cpu_percentage, peak_memory_mib)
+    """
+    rng = np.random.default_rng([seed, n])
+    A = rng.random((n, n), dtype=np.float32)
+    B = rng.random((n, n), dtype=np.float32)
+    C = np.empty((n, n), dtype=np.float32)
+    
+    proc = psutil.Process(os.getpid())
+    ncpu = psutil.cpu_count(logical=True) or 1
+    return one_run(A, B, proc, ncpu, matmul, collect_metrics, out=C)
 
 
 def write_header_if_needed(path: str) -> None:
@@ -110,7 +275,7 @@ def main() -> None:
     
     Parses command-line arguments, verifies correctness, generates random
     matrices, and runs the matrix multiplication benchmark for each
-    specified size and run count.
+    selected implementation, size and run count.
     """
     # Parse command-line arguments
     p = argparse.ArgumentParser(description="Raw-run Python benchmark.")
@@ -124,39 +289,111 @@ def main() -> None:
                    help="Random seed for reproducibility")
     p.add_argument("--check_n", type=int, default=5,
                    help="Matrix size for correctness verification")
+    p.add_argument("--impl", type=str, nargs="+", choices=list(IMPLEMENTATIONS),
+                   default=list(IMPLEMENTATIONS),
+                   help="Matrix multiplication implementations to benchmark")
+    p.add_argument("--block", type=int, default=64,
+                   help="Tile size (BM = BN = BK) for the blocked implementation")
+    p.add_argument("--parallel", action="store_true",
+                   help="Run the repetitions of each size concurrently in a process "
+                        "pool (timing surveys only: inflates CPU %% and memory)")
     args = p.parse_args()
 
-    # Verify implementation correctness before benchmarking
-    if not check_correctness(args.check_n, args.seed):
-        raise SystemExit("Verification failed")
+    # Resolve the selected implementations as (language label, function) pairs,
+    # along with the matrix sizes each one is verified at
+    implementations = []
+    check_sizes = {}
+    for name in args.impl:
+        language, matmul = IMPLEMENTATIONS[name]
+        check_sizes[language] = [args.check_n]
+        if name == "blocked":
+            matmul = functools.partial(matmul, BM=args.block, BN=args.block, BK=args.block)
+            check_sizes[language].append(blocked_check_size(args.block))
+        implementations.append((language, matmul))
+
+    for language, matmul in implementations:
+        # Verify implementation correctness before benchmarking
+        # (for JIT implementations this also triggers compilation, so compile
+        # time is excluded from the timed runs below)
+        for check_n in check_sizes[language]:
+            if not check_correctness(check_n, args.seed, matmul=matmul):
+                raise SystemExit(f"Verification failed for {language} (n={check_n})")
+
+    # Warm up the JIT for the float32 signature used by the timed loop
+    matmuls = [matmul for _, matmul in implementations]
+    warm_up(matmuls)
+
+    # Move long-lived objects (modules, compiled kernels) out of the GC's
+    # view so any collection that does run has less to scan
+    gc.collect()
+    gc.freeze()
 
     # Initialize components
     rng = np.random.default_rng(args.seed)
     proc = psutil.Process(os.getpid())
     ncpu = psutil.cpu_count(logical=True) or 1
-    language = "Python"
     run_id = time.strftime("%d/%m/%H/%M", time.localtime())
 
     # Prepare output file
     write_header_if_needed(args.out)
 
-    # Main benchmarking loop: iterate over all matrix sizes
-    for n in args.sizes:
-        # Generate random matrices for this size
-        A = rng.random((n, n), dtype=np.float32)
-        B = rng.random((n, n), dtype=np.float32)
+    # Process pool for --parallel; each worker warms up the JIT on start.
+    # Workers are spawned, not forked: the threaded kernels have already run
+    # in this process, and forking after OpenMP has started is unsafe.
+    if args.parallel:
+        pool = ProcessPoolExecutor(
+            max_workers=ncpu,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_up,
+            initargs=(matmuls,),
+        )
+    else:
+        pool = contextlib.nullcontext()
+
+    # Keep the output file open for the whole sweep; rows are written and
+    # flushed in batches per (size, implementation)
+    with pool as executor, open(args.out, "a", encoding="utf-8", newline="") as out_f:
+        w = csv.writer(out_f, delimiter=";", lineterminator="\n")
         
-        # Perform multiple runs for statistical stability
-        for r in range(1, args.runs + 1):
-            # Execute run and collect metrics
-            t_ms, cpu_pct, peak_mib = one_run(A, B, proc, ncpu)
-            
-            # Print results to console
-            print(f"n={n} run={r} time={t_ms:.2f} ms CPU={cpu_pct:.1f}% MEM={peak_mib:.2f} MiB")
+        # Main benchmarking loop: iterate over all matrix sizes
+        for n in args.sizes:
+            # Generate random matrices for this size
+            A = rng.random((n, n), dtype=np.float32)
+            B = rng.random((n, n), dtype=np.float32)
+            C = np.empty((n, n), dtype=np.float32)  # Output buffer reused by every run
+            collect_metrics = n >= METRICS_MIN_SIZE
             
-            # Append results to CSV file
-            with open(args.out, "a", encoding="utf-8") as f:
-                f.write(f"{run_id};{language};{n};{r};{t_ms:.3f};{cpu_pct:.1f};{peak_mib:.2f}\n")
+            for language, matmul in implementations:
+                # Perform multiple runs for statistical stability, either
+                # one after another or scattered across the process pool
+                if executor is None:
+                    results = (
+                        one_run(A, B, proc, ncpu, matmul, collect_metrics, out=C)
+                        for _ in range(args.runs)
+                    )
+                else:
+                    results = executor.map(
+                        pool_run,
+                        [matmul] * args.runs,
+                        [n] * args.runs,
+                        [args.seed] * args.runs,
+                        [collect_metrics] * args.runs,
+                    )
+                
+                rows = []
+                for r, (t_ms, cpu_pct, peak_mib) in enumerate(results, start=1):
+                    # Print results to console
+                    print(f"{language} n={n} run={r} time={t_ms:.2f} ms "
+                          f"CPU={cpu_pct:.1f}% MEM={peak_mib:.2f} MiB")
+                    
+                    # Buffer the row; written in one batch after the runs
+                    rows.append((run_id, language, n, r,
+                                 f"{t_ms:.3f}", f"{cpu_pct:.1f}", f"{peak_mib:.2f}"))
+                
+                # Append this batch to the CSV file and flush so partial
+                # sweeps are kept if the benchmark is interrupted
+                w.writerows(rows)
+                out_f.flush()
 
 
 if __name__ == "__main__":
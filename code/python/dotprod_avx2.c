@@ -0,0 +1,76 @@
+/**
+ * @file dotprod_avx2.c
+ * @brief AVX2/FMA float32 dot product, loaded from Python via ctypes
+ *
+ * Shared library backing `matrix_mult.matmul_avx2`: Python keeps the i-j
+ * loops and calls this kernel for each inner k-loop (row of A · column of B).
+ *
+ * Only `dot_avx2` is compiled for AVX2/FMA (via a target attribute), so the
+ * library loads on any x86-64 CPU and `avx2_supported` can be queried before
+ * the kernel is used.
+ *
+ * Build (from code/python):
+ *   gcc -O3 -shared -fPIC dotprod_avx2.c -o dotprod_avx2.so
+ */
+
+#include <immintrin.h>
+
+/**
+ * @brief Check whether the running CPU supports AVX2 and FMA
+ * @return 1 if `dot_avx2` is safe to call, 0 otherwise
+ */
+int avx2_supported(void) {
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma");
+}
+
+/**
+ * @brief Dot product of two float32 vectors using 8-wide FMA
+ *
+ * Implementation details:
+ * - Four independent __m256 accumulators (32 floats per iteration) hide the
+ *   latency of back-to-back FMAs on the same register
+ * - Unaligned loads, so any offset into a NumPy buffer is accepted
+ * - Accumulators are reduced to one vector, then summed horizontally
+ * - Remaining elements (n not a multiple of 8) use a scalar tail loop
+ *
+ * @param u Pointer to first vector (n floats)
+ * @param v Pointer to second vector (n floats)
+ * @param n Number of elements
+ * @return Sum of u[k] * v[k] for k in [0, n)
+ */
+__attribute__((target("avx2,fma")))
+float dot_avx2(const float* u, const float* v, int n) {
+    __m256 t0 = _mm256_setzero_ps();
+    __m256 t1 = _mm256_setzero_ps();
+    __m256 t2 = _mm256_setzero_ps();
+    __m256 t3 = _mm256_setzero_ps();
+    int k = 0;
+
+    /* Main loop: 4 × 8 floats per iteration */
+    for (; k + 32 <= n; k += 32) {
+        t0 = _mm256_fmadd_ps(_mm256_loadu_ps(u + k),      _mm256_loadu_ps(v + k),      t0);
+        t1 = _mm256_fmadd_ps(_mm256_loadu_ps(u + k + 8),  _mm256_loadu_ps(v + k + 8),  t1);
+        t2 = _mm256_fmadd_ps(_mm256_loadu_ps(u + k + 16), _mm256_loadu_ps(v + k + 16), t2);
+        t3 = _mm256_fmadd_ps(_mm256_loadu_ps(u + k + 24), _mm256_loadu_ps(v + k + 24), t3);
+    }
+
+    /* Remaining full 8-wide chunks */
+    for (; k + 8 <= n; k += 8) {
+        t0 = _mm256_fmadd_ps(_mm256_loadu_ps(u + k), _mm256_loadu_ps(v + k), t0);
+    }
+
+    /* Reduce the four accumulators, then sum the 8 lanes */
+    __m256 t = _mm256_add_ps(_mm256_add_ps(t0, t1), _mm256_add_ps(t2, t3));
+    __m128 s = _mm_add_ps(_mm256_castps256_ps128(t), _mm256_extractf128_ps(t, 1));
+    s = _mm_add_ps(s, _mm_movehl_ps(s, s));
+    s = _mm_add_ss(s, _mm_movehdup_ps(s));
+    float acc = _mm_cvtss_f32(s);
+
+    /* Scalar tail */
+    for (; k < n; k++) {
+        acc += u[k] * v[k];
+    }
+
+    return acc;
+}
@@ -1,16 +1,87 @@
 """
-Basic matrix multiplication implementation using triple-nested loops.
+Matrix multiplication implementations for the Python benchmark.
 
-This module provides a naive O(n³) matrix multiplication algorithm for
-benchmarking purposes. It intentionally avoids optimizations and external
-libraries (except NumPy for array handling) to provide a fair baseline
-comparison across languages.
+The baseline, `matrixMultiplication`, is a naive O(n³) triple-loop
+algorithm. It avoids blocking, compilation and external libraries (NumPy
+only holds the arrays) to provide a fair baseline comparison across
+languages.
+
+Numba-compiled variants (`matmul_numba` and the cache-blocked
+`matmul_blocked`) are provided alongside the baseline to measure how far the
+same algorithm goes once interpreter overhead and cache misses are removed.
+`matmul_numpy` wraps NumPy's BLAS-backed `@` as an optimized reference.
+`matmul_avx2` keeps the Python loops but hands each inner dot product to a
+hand-written AVX2 kernel (dotprod_avx2.c) loaded through ctypes.
 """
 
+import ctypes
+import os
+from typing import Optional
+
 import numpy as np
+from numba import njit, prange
+
+# Micro-tile shape of the register-blocked kernel: MR rows of A × NR columns
+# of B. 6×16 float32 fits the accumulators of an AVX2 core (16 ymm registers).
+MR = 6
+NR = 16
+
+# Optional AVX2 dot-product kernel, built next to this module with
+#   gcc -O3 -shared -fPIC dotprod_avx2.c -o dotprod_avx2.so
+_DOT_AVX2_LIB = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "dotprod_avx2.dll" if os.name == "nt" else "dotprod_avx2.so",
+)
+try:
+    _lib = ctypes.CDLL(_DOT_AVX2_LIB)
+    _dot_avx2 = _lib.dot_avx2
+    _dot_avx2.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int]
+    _dot_avx2.restype = ctypes.c_float
+    # Calling the kernel on a CPU without AVX2/FMA would die with SIGILL
+    if not _lib.avx2_supported():
+        _dot_avx2 = None
+except (OSError, AttributeError):
+    # Library not built, or built from an older source without these symbols
+    _dot_avx2 = None
+
+# True when the AVX2 kernel was loaded and the CPU supports AVX2 and FMA,
+# i.e. `matmul_avx2` can be used
+HAVE_AVX2 = _dot_avx2 is not None
 
 
-def matrixMultiplication(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+def _zeroed_output(
+    A: np.ndarray, B: np.ndarray, out: Optional[np.ndarray]
+) -> np.ndarray:
+    """
+    Return a zero-filled output buffer for A × B.
+    
+    Allocates a new (n, p) matrix with A's dtype when `out` is None;
+    otherwise clears `out` in place. Filling resident pages is cheaper than
+    a fresh `np.zeros`, which page-faults its memory in on first touch.
+    
+    Args:
+        A: First input matrix of shape (n, m)
+        B: Second input matrix of shape (m, p)
+        out: Optional preallocated output buffer
+    
+    Returns:
+        Zero-filled matrix of shape (n, p)
+    
+    Raises:
+        ValueError: If `out` does not have shape (n, p)
+    """
+    shape = (A.shape[0], B.shape[1])
+    if out is None:
+        return np.zeros(shape, dtype=A.dtype)
+    if out.shape != shape:
+        raise ValueError(f"Incompatible output shape: out.shape={out.shape}, expected {shape}")
+    out.fill(0)
+    return out
+
+
+def matrixMultiplication(
+    A: np.ndarray, B: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Multiply two matrices using the classical triple-loop algorithm.
     
@@ -19,6 +90,10 @@ def matrixMultiplication(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     
     This implementation uses explicit loops rather than optimized BLAS routines
     to provide a consistent baseline for cross-language performance comparisons.
+    The loops run in i-k-j order: the innermost j loop is expressed as a single
+    row update C[i,:] += A[i,k] * B[k,:], which walks B and C contiguously
+    instead of striding down a column of B. Loop order is the only change with
+    respect to the textbook i-j-k formulation; the operation count is the same.
     
     Time Complexity: O(n * m * p) where A is (n×m) and B is (m×p)
     Space Complexity: O(n * p) for the output matrix
@@ -26,6 +101,8 @@ def matrixMultiplication(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     Args:
         A: First input matrix of shape (n, m)
         B: Second input matrix of shape (m, p)
+        out: Optional preallocated output of shape (n, p). It is zero-filled
+            and returned, which avoids allocating a fresh matrix per call.
     
     Returns:
         Result matrix C of shape (n, p)
@@ -34,17 +111,16 @@ def matrixMultiplication(A: np.ndarray, B: np.ndarray) -> np.ndarray:
         ValueError: If matrix dimensions are incompatible (A.shape[1] != B.shape[0])
     
     Examples:
-        >>> A = np.array([[1, 2], [3, 4]])
-        >>> B = np.array([[5, 6], [7, 8]])
+        >>> A = np.array([[1., 2.], [3., 4.]])
+        >>> B = np.array([[5., 6.], [7., 8.]])
         >>> C = matrixMultiplication(A, B)
         >>> C
         array([[19., 22.],
                [43., 50.]])
     
     Notes:
-        - Uses explicit type casting to float to ensure consistent behavior
-        - Accumulates in a scalar variable for clarity and consistency
-        - Output dtype matches input A's dtype
+        - Each inner step is one AXPY over a contiguous row of B and C
+        - Output dtype matches input A's dtype (or out's dtype if given)
     """
     # Validate matrix dimensions for multiplication
     if A.shape[1] != B.shape[0]:
@@ -59,15 +135,399 @@ def matrixMultiplication(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     p = B.shape[1]  # Number of columns in B
     
     # Initialize output matrix with zeros
-    C = np.zeros((n, p), dtype=A.dtype)
+    C = _zeroed_output(A, B, out)
     
-    # Triple-nested loop: O(n³) for square matrices
+    # Triple-nested loop in i-k-j order: O(n³) for square matrices
     for i in range(n):              # Iterate over rows of A
-        for j in range(p):          # Iterate over columns of B
-            acc = 0.0               # Accumulator for dot product
-            for k in range(m):      # Iterate over common dimension
-                # Compute dot product: row i of A with column j of B
-                acc += float(A[i, k]) * float(B[k, j])
-            C[i, j] = acc           # Store result
-    
-    return C
\ No newline at end of file
+        for k in range(m):          # Iterate over common dimension
+            # Inner j loop over columns of B: add A[i,k] * row k of B to row i of C
+            C[i] += A[i, k] * B[k]
+    
+    return C
+
+
+def matmul_numpy(
+    A: np.ndarray, B: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Multiply two matrices with NumPy's `@` operator (BLAS GEMM).
+    
+    Reference point for the hand-written implementations: NumPy dispatches
+    to the optimized BLAS library it was built against (e.g. OpenBLAS).
+    
+    Args:
+        A: First input matrix of shape (n, m)
+        B: Second input matrix of shape (m, p)
+        out: Optional preallocated output of shape (n, p), overwritten and
+            returned
+    
+    Returns:
+        Result matrix C of shape (n, p)
+    """
+    return np.matmul(A, B, out=out)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _matmul_ikj(A: np.ndarray, B: np.ndarray, C: np.ndarray) -> None:
+    """
+    JIT-compiled kernel accumulating A × B into C using i-k-j loop order.
+    
+    Rows of C are distributed across threads with `prange`. The inner k-j
+    pair streams row B[k, :] into row C[i, :], so both innermost accesses
+    are contiguous and LLVM can vectorize them into FMA loops.
+    
+    Args:
+        A: First input matrix of shape (n, m)
+        B: Second input matrix of shape (m, p)
+        C: Zero-initialized output matrix of shape (n, p), updated in place
+    """
+    n, m = A.shape
+    p = B.shape[1]
+    
+    for i in prange(n):             # Rows of A / C, one per thread
+        for k in range(m):          # Common dimension
+            a = A[i, k]             # Broadcast A[i,k] across row k of B
+            for j in range(p):      # Contiguous sweep over row k of B
+                C[i, j] += a * B[k, j]
+
+
+def matmul_numba(
+    A: np.ndarray, B: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Multiply two matrices with the Numba-compiled i-k-j kernel.
+    
+    Same O(n * m * p) algorithm as `matrixMultiplication`, but compiled to
+    native code and parallelized over rows. The first call for a given
+    dtype triggers JIT compilation, so callers timing this function should
+    warm it up first.
+    
+    Args:
+        A: First input matrix of shape (n, m)
+        B: Second input matrix of shape (m, p)
+        out: Optional preallocated output of shape (n, p). It is zero-filled
+            and returned, which avoids allocating a fresh matrix per call.
+    
+    Returns:
+        Result matrix C of shape (n, p)
+    
+    Raises:
+        ValueError: If matrix dimensions are incompatible (A.shape[1] != B.shape[0])
+    """
+    # Validate matrix dimensions for multiplication
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(
+            f"Incompatible shapes: A.shape={A.shape}, B.shape={B.shape}. "
+            f"A.shape[1] must equal B.shape[0]"
+        )
+    
+    # Initialize output matrix with zeros and accumulate into it
+    C = _zeroed_output(A, B, out)
+    _matmul_ikj(A, B, C)
+    
+    return C
+
+
+@njit(fastmath=True, boundscheck=False, cache=True)
+def _pack_A(
+    A: np.ndarray, i0: int, k0: int, BM: int, BK: int, Apack: np.ndarray
+) -> None:
+    """
+    Pack the BM×BK block of A at (i0, k0) into MR-row panels.
+    
+    Panel `ip` starts at `ip * MR * kc` and stores its MR rows one after the
+    other, each row holding `kc` contiguous entries A[i, k0:k0 + kc]. Rows
+    past the bottom edge of A are zero-filled so the micro-kernel always
+    sees full panels.
+    
+    Args:
+        A: Source matrix of shape (n, m)
+        i0: First row of the block
+        k0: First column of the block
+        BM: Block height
+        BK: Block depth
+        Apack: Flat scratch buffer of at least ceil(BM / MR) * MR * BK entries
+    """
+    n, m = A.shape
+    mc = min(BM, n - i0)
+    kc = min(BK, m - k0)
+    
+    for ip in range((mc + MR - 1) // MR):           # Panels of MR rows
+        base = ip * MR * kc
+        for r in range(MR):
+            i = i0 + ip * MR + r
+            dst = base + r * kc
+            if i < i0 + mc:
+                for k in range(kc):
+                    Apack[dst + k] = A[i, k0 + k]
+            else:
+                for k in range(kc):
+                    Apack[dst + k] = 0
+
+
+@njit(fastmath=True, boundscheck=False, cache=True)
+def _pack_B(
+    B: np.ndarray, k0: int, j0: int, BK: int, BN: int, Bpack: np.ndarray
+) -> None:
+    """
+    Pack the BK×BN block of B at (k0, j0) into NR-column panels.
+    
+    Panel `jp` starts at `jp * NR * kc` and stores its NR columns one after
+    the other, each column holding `kc` contiguous entries B[k0:k0 + kc, j].
+    Columns past the right edge of B are zero-filled so the micro-kernel
+    always sees full panels.
+    
+    Args:
+        B: Source matrix of shape (m, p)
+        k0: First row of the block
+        j0: First column of the block
+        BK: Block depth
+        BN: Block width
+        Bpack: Flat scratch buffer of at least ceil(BN / NR) * NR * BK entries
+    """
+    m, p = B.shape
+    kc = min(BK, m - k0)
+    nc = min(BN, p - j0)
+    
+    for jp in range((nc + NR - 1) // NR):           # Panels of NR columns
+        base = jp * NR * kc
+        for c in range(NR):
+            j = j0 + jp * NR + c
+            dst = base + c * kc
+            if j < j0 + nc:
+                for k in range(kc):
+                    Bpack[dst + k] = B[k0 + k, j]
+            else:
+                for k in range(kc):
+                    Bpack[dst + k] = 0
+
+
+@njit(fastmath=True, boundscheck=False, cache=True)
+def _ukernel_6x16(
+    kc: int,
+    Apack: np.ndarray,
+    a_off: int,
+    Bpack: np.ndarray,
+    b_off: int,
+    C_tile: np.ndarray,
+) -> None:
+    """
+    Register-blocked micro-kernel: C_tile += A panel × B panel.
+    
+    For each of the NR columns of the tile, six independent accumulators
+    c0..c5 (one per row) are carried through the k loop. Because the six
+    FMA chains do not depend on each other, the CPU can overlap them and
+    hide the FMA latency that serializes a single-accumulator loop. Both
+    panels are stored with k as the contiguous axis, so every load in the
+    k loop is stride-1 and LLVM can vectorize it.
+    
+    Args:
+        kc: Depth of the panels (number of k entries per row/column)
+        Apack: Flat buffer filled by `_pack_A`
+        a_off: Offset of the MR-row panel of A inside Apack
+        Bpack: Flat buffer filled by `_pack_B`
+        b_off: Offset of the NR-column panel of B inside Bpack
+        C_tile: Output micro-tile of shape (MR, NR), updated in place
+    """
+    # Zero-based row views of the A panel: non-negative loop indices let
+    # Numba skip wraparound handling and vectorize the k loop
+    a0 = Apack[a_off:a_off + kc]
+    a1 = Apack[a_off + kc:a_off + 2 * kc]
+    a2 = Apack[a_off + 2 * kc:a_off + 3 * kc]
+    a3 = Apack[a_off + 3 * kc:a_off + 4 * kc]
+    a4 = Apack[a_off + 4 * kc:a_off + 5 * kc]
+    a5 = Apack[a_off + 5 * kc:a_off + 6 * kc]
+    
+    for j in range(NR):
+        b_col = Bpack[b_off + j * kc:b_off + (j + 1) * kc]
+        # Load the accumulators from the tile so the kernel is dtype-agnostic
+        c0 = C_tile[0, j]
+        c1 = C_tile[1, j]
+        c2 = C_tile[2, j]
+        c3 = C_tile[3, j]
+        c4 = C_tile[4, j]
+        c5 = C_tile[5, j]
+        for k in range(kc):
+            b = b_col[k]
+            c0 += a0[k] * b
+            c1 += a1[k] * b
+            c2 += a2[k] * b
+            c3 += a3[k] * b
+            c4 += a4[k] * b
+            c5 += a5[k] * b
+        C_tile[0, j] = c0
+        C_tile[1, j] = c1
+        C_tile[2, j] = c2
+        C_tile[3, j] = c3
+        C_tile[4, j] = c4
+        C_tile[5, j] = c5
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _matmul_blocked(
+    A: np.ndarray, B: np.ndarray, C: np.ndarray, BM: int, BN: int, BK: int
+) -> None:
+    """
+    JIT-compiled cache-blocked kernel accumulating A × B into C.
+    
+    The iteration space is split into BM-row blocks of A, BK-wide slabs of
+    the common dimension and BN-column blocks of B. Each BM×BK block of A
+    is packed once per (i0, k0) with `_pack_A`, and each BK×BN block of B
+    once per (k0, j0) with `_pack_B`, so the micro-kernel reads stride-1
+    streams from cache-resident buffers. Row blocks of C are distributed
+    across threads with `prange`; edge tiles are clipped with `min(...)`
+    bounds and zero-padded by the packing routines.
+    
+    Args:
+        A: First input matrix of shape (n, m)
+        B: Second input matrix of shape (m, p)
+        C: Zero-initialized output matrix of shape (n, p), updated in place
+        BM: Tile height (rows of A and C)
+        BN: Tile width (columns of B and C)
+        BK: Tile depth (common dimension)
+    """
+    n, m = A.shape
+    p = B.shape[1]
+    n_row_blocks = (n + BM - 1) // BM
+    
+    for ib in prange(n_row_blocks):                 # Row blocks of C, one per thread
+        # Per-thread scratch, allocated once and reused for every block
+        Apack = np.empty(((BM + MR - 1) // MR) * MR * BK, dtype=A.dtype)
+        Bpack = np.empty(((BN + NR - 1) // NR) * NR * BK, dtype=B.dtype)
+        C_tile = np.empty((MR, NR), dtype=C.dtype)
+        
+        i0 = ib * BM
+        i_end = min(i0 + BM, n)
+        for k0 in range(0, m, BK):                  # Slabs of the common dimension
+            kc = min(BK, m - k0)
+            _pack_A(A, i0, k0, BM, BK, Apack)
+            for j0 in range(0, p, BN):              # Column blocks of C
+                j_end = min(j0 + BN, p)
+                _pack_B(B, k0, j0, BK, BN, Bpack)
+                
+                for ir in range(i0, i_end, MR):     # Micro-tile rows
+                    mr = min(MR, i_end - ir)
+                    a_off = (ir - i0) * kc
+                    for jr in range(j0, j_end, NR): # Micro-tile columns
+                        nr = min(NR, j_end - jr)
+                        b_off = (jr - j0) * kc
+                        C_tile[:, :] = 0
+                        _ukernel_6x16(kc, Apack, a_off, Bpack, b_off, C_tile)
+                        C[ir:ir + mr, jr:jr + nr] += C_tile[:mr, :nr]
+
+
+def matmul_blocked(
+    A: np.ndarray,
+    B: np.ndarray,
+    BM: int = 64,
+    BN: int = 64,
+    BK: int = 64,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Multiply two matrices with the Numba-compiled cache-blocked kernel.
+    
+    Same O(n * m * p) algorithm as `matmul_numba`, but iterating over tiles
+    so the working set of each inner step fits in cache. This matters once
+    the three matrices no longer fit in L2 (n ≥ 512 for float32). Inside a
+    tile, the work is done by a 6×16 register-blocked micro-kernel.
+    
+    Args:
+        A: First input matrix of shape (n, m)
+        B: Second input matrix of shape (m, p)
+        BM: Tile height (rows of A and C)
+        BN: Tile width (columns of B and C)
+        BK: Tile depth (common dimension)
+        out: Optional preallocated output of shape (n, p). It is zero-filled
+            and returned, which avoids allocating a fresh matrix per call.
+    
+    Returns:
+        Result matrix C of shape (n, p)
+    
+    Raises:
+        ValueError: If matrix dimensions are incompatible (A.shape[1] != B.shape[0])
+            or if any tile size is not positive
+    """
+    # Validate matrix dimensions for multiplication
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(
+            f"Incompatible shapes: A.shape={A.shape}, B.shape={B.shape}. "
+            f"A.shape[1] must equal B.shape[0]"
+        )
+    if min(BM, BN, BK) <= 0:
+        raise ValueError(f"Tile sizes must be positive, got BM={BM}, BN={BN}, BK={BK}")
+    
+    # Initialize output matrix with zeros and accumulate into it
+    C = _zeroed_output(A, B, out)
+    _matmul_blocked(A, B, C, BM, BN, BK)
+    
+    return C
+
+
+def matmul_avx2(
+    A: np.ndarray, B: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Multiply two matrices with Python i-j loops around an AVX2 dot product.
+    
+    B is transposed once up front so every column of B becomes a contiguous
+    row of Bt; each C[i, j] is then a single call to the C kernel
+    `dot_avx2(A[i, :], Bt[j, :], m)`. Only the inner k loop leaves Python,
+    which isolates the gain of SIMD/FMA over the interpreted baseline while
+    the per-element call overhead stays visible.
+    
+    Args:
+        A: First input matrix of shape (n, m)
+        B: Second input matrix of shape (m, p)
+        out: Optional preallocated float32 output of shape (n, p). Every
+            element is overwritten, so it is not zero-filled first.
+    
+    Returns:
+        Result matrix C of shape (n, p), dtype float32
+    
+    Raises:
+        RuntimeError: If the dotprod_avx2 shared library has not been built
+            or the CPU lacks AVX2/FMA
+        ValueError: If matrix dimensions are incompatible (A.shape[1] != B.shape[0])
+            or `out` is not a float32 array of shape (n, p)
+    """
+    if _dot_avx2 is None:
+        raise RuntimeError(
+            f"AVX2 kernel unavailable: build {_DOT_AVX2_LIB} on a CPU with AVX2 and FMA"
+        )
+    
+    # Validate matrix dimensions for multiplication
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(
+            f"Incompatible shapes: A.shape={A.shape}, B.shape={B.shape}. "
+            f"A.shape[1] must equal B.shape[0]"
+        )
+    
+    # The kernel reads raw float32 rows: make A and B^T C-contiguous float32
+    A = np.ascontiguousarray(A, dtype=np.float32)
+    Bt = np.ascontiguousarray(B.T, dtype=np.float32)
+    
+    # Every element of C is assigned below, so no zero-fill is needed
+    shape = (A.shape[0], B.shape[1])
+    if out is None:
+        C = np.empty(shape, dtype=np.float32)
+    else:
+        if out.shape != shape:
+            raise ValueError(f"Incompatible output shape: out.shape={out.shape}, expected {shape}")
+        if out.dtype != np.float32:
+            raise ValueError(f"Incompatible output dtype: out.dtype={out.dtype}, expected float32")
+        C = out
+    
+    n, m = A.shape
+    p = Bt.shape[0]
+    row_bytes = m * A.itemsize
+    a_ptr = A.ctypes.data
+    bt_ptr = Bt.ctypes.data
+    dot = _dot_avx2
+    
+    for i in range(n):                              # Rows of A / C
+        a_row = a_ptr + i * row_bytes
+        # Columns of B: one AVX2 dot product over the common dimension each
+        C[i] = [dot(a_row, bt_ptr + j * row_bytes, m) for j in range(p)]
+    
+    return C
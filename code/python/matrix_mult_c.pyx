@@ -0,0 +1,100 @@
+# cython: language_level=3
+"""
+Cython implementation of matrix multiplication.
+
+Compiled ahead of time to a C extension (see setup.py), this is the rung
+between the Numba JIT and BLAS: the same i-k-j triple loop as
+`matrix_mult.matmul_numba`, left to the C compiler to auto-vectorize with
+-O3 -march=native -ffast-math, and parallelized over rows with OpenMP.
+
+Build:
+    python setup.py build_ext --inplace
+"""
+
+import numpy as np
+
+cimport cython
+from cython.parallel cimport prange
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void _matmul_ikj(float[:, ::1] A, float[:, ::1] B, float[:, ::1] C) noexcept nogil:
+    """
+    Accumulate A × B into C using i-k-j loop order.
+
+    Rows of C are split across OpenMP threads (`prange` emits
+    `#pragma omp parallel for`). The innermost loop streams row B[k, :]
+    into row C[i, :], so both accesses are unit-stride and vectorize into
+    FMA instructions.
+
+    Args:
+        A: First input matrix of shape (n, m), C-contiguous float32
+        B: Second input matrix of shape (m, p), C-contiguous float32
+        C: Zero-initialized output matrix of shape (n, p), updated in place
+    """
+    cdef Py_ssize_t n = A.shape[0]
+    cdef Py_ssize_t m = A.shape[1]
+    cdef Py_ssize_t p = B.shape[1]
+    cdef Py_ssize_t i, k, j
+    cdef float a
+
+    for i in prange(n, schedule="static"):     # Rows of A / C, one per thread
+        for k in range(m):                      # Common dimension
+            a = A[i, k]                         # Broadcast A[i,k] across row k of B
+            for j in range(p):                  # Contiguous sweep over row k of B
+                C[i, j] += a * B[k, j]
+
+
+def matmul(A, B, out=None):
+    """
+    Multiply two matrices with the compiled Cython i-k-j kernel.
+
+    Inputs are converted to C-contiguous float32 (a no-op for the arrays
+    the benchmark harness builds), matching the kernel's typed memoryviews.
+
+    Args:
+        A: First input matrix of shape (n, m)
+        B: Second input matrix of shape (m, p)
+        out: Optional preallocated float32 output of shape (n, p). It is
+            zero-filled and returned, which avoids allocating a fresh matrix
+            per call.
+
+    Returns:
+        Result matrix C of shape (n, p), dtype float32
+
+    Raises:
+        ValueError: If matrix dimensions are incompatible (A.shape[1] != B.shape[0])
+            or `out` does not have shape (n, p)
+
+    Examples:
+        >>> A = np.array([[1, 2], [3, 4]], dtype=np.float32)
+        >>> B = np.array([[5, 6], [7, 8]], dtype=np.float32)
+        >>> matmul(A, B)
+        array([[19., 22.],
+               [43., 50.]], dtype=float32)
+    """
+    A = np.ascontiguousarray(A, dtype=np.float32)
+    B = np.ascontiguousarray(B, dtype=np.float32)
+
+    # Validate matrix dimensions for multiplication
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(
+            f"Incompatible shapes: A.shape={A.shape}, B.shape={B.shape}. "
+            f"A.shape[1] must equal B.shape[0]"
+        )
+
+    # Initialize output matrix with zeros and accumulate into it
+    shape = (A.shape[0], B.shape[1])
+    if out is None:
+        C = np.zeros(shape, dtype=np.float32)
+    else:
+        if out.shape != shape:
+            raise ValueError(f"Incompatible output shape: out.shape={out.shape}, expected {shape}")
+        out.fill(0)
+        C = out
+
+    _matmul_ikj(A, B, C)
+
+    return C
@@ -3,8 +3,9 @@ Aggregate per-run benchmark results into summary statistics.
 
 This script reads raw benchmark results from a CSV file, computes summary
 statistics (mean, min, max) per language and matrix size, and writes the
-aggregated results to a new CSV file with Excel-friendly decimal formatting
-(comma as decimal separator).
+aggregated results to a new CSV file. The summary keeps dot decimals so
+downstream tools can read it directly; an optional Excel-friendly copy
+(comma as decimal separator) is written only when --excel-out is given.
 
 Input CSV format (semicolon-separated):
     run_id;language;size;run_idx;time_ms;cpu_pct;peak_mib
@@ -14,6 +15,7 @@ Output CSV format (semicolon-separated):
 
 Usage:
     python aggregate_results.py --inp results_raw.csv --out results_summary.csv
+    python aggregate_results.py --excel-out results_summary_excel.csv
 """
 
 import argparse
@@ -46,17 +48,38 @@ def fmt(x: float, nd: int) -> str:
     return f"{float(x):.{nd}f}".replace(".", ",")
 
 
+def _fmt_col(s: pd.Series, nd: int) -> pd.Series:
+    """
+    Format a numeric column with comma decimal separator, like `fmt`.
+    
+    Rounds once and formats the whole column with a single formatter,
+    then swaps the decimal separator with a vectorized string replace.
+    
+    Args:
+        s: Numeric Series to format
+        nd: Number of decimal places
+    
+    Returns:
+        Series of strings with comma as decimal separator
+    
+    Examples:
+        >>> _fmt_col(pd.Series([1234.567, 3.14159]), 2).tolist()
+        ['1234,57', '3,14']
+    """
+    return s.round(nd).map(f"{{:.{nd}f}}".format).str.replace(".", ",", regex=False)
+
+
 def main():
     """
     Main entry point for the aggregation script.
     
     Parses command-line arguments, reads raw benchmark data, computes summary
     statistics grouped by run_id, language, and size, and writes the results
-    to a CSV file with Excel-friendly formatting.
+    to a dot-decimal CSV file, plus an Excel-friendly copy if requested.
     """
     # Parse command-line arguments
     ap = argparse.ArgumentParser(
-        description="Aggregate per-run results with Excel-friendly decimals."
+        description="Aggregate per-run results into summary statistics."
     )
     ap.add_argument(
         "--inp", 
@@ -70,6 +93,12 @@ def main():
         default="results_summary.csv",
         help="Output CSV file for aggregated summary statistics"
     )
+    ap.add_argument(
+        "--excel-out",
+        type=str,
+        default=None,
+        help="Optional extra copy of the summary with comma decimals for Excel"
+    )
     args = ap.parse_args()
     
     # Read raw benchmark data
@@ -97,19 +126,26 @@ def main():
         peak_mib=("peak_mib", "max"),         # Peak memory consumption
     ).sort_values(["language", "size", "run_id"])
     
-    # Round and format numeric columns with comma decimal separator for Excel
-    # This ensures compatibility with European Excel locale settings
-    summary["avg_time_ms"] = summary["avg_time_ms"].round(3).map(lambda v: fmt(v, 3))
-    summary["min_time_ms"] = summary["min_time_ms"].round(3).map(lambda v: fmt(v, 3))
-    summary["max_time_ms"] = summary["max_time_ms"].round(3).map(lambda v: fmt(v, 3))
-    summary["cpu_pct_avg"] = summary["cpu_pct_avg"].round(1).map(lambda v: fmt(v, 1))
-    summary["peak_mib"] = summary["peak_mib"].round(2).map(lambda v: fmt(v, 2))
+    # Write the canonical summary with dot decimals
+    summary.to_csv(args.out, index=False, sep=SEP, float_format="%.3f")
     
-    # Write summary to output CSV with UTF-8-BOM encoding for Excel compatibility
-    summary.to_csv(args.out, index=False, sep=SEP, encoding="utf-8-sig")
+    if args.excel_out:
+        # Round and format numeric columns with comma decimal separator for Excel
+        # This ensures compatibility with European Excel locale settings
+        excel = summary.copy()
+        excel["avg_time_ms"] = _fmt_col(excel["avg_time_ms"], 3)
+        excel["min_time_ms"] = _fmt_col(excel["min_time_ms"], 3)
+        excel["max_time_ms"] = _fmt_col(excel["max_time_ms"], 3)
+        excel["cpu_pct_avg"] = _fmt_col(excel["cpu_pct_avg"], 1)
+        excel["peak_mib"] = _fmt_col(excel["peak_mib"], 2)
+        
+        # Write with UTF-8-BOM encoding for Excel compatibility
+        excel.to_csv(args.excel_out, index=False, sep=SEP, encoding="utf-8-sig")
     
     print(f"Aggregated {len(df)} raw records into {len(summary)} summary rows")
     print(f"Results written to: {args.out}")
+    if args.excel_out:
+        print(f"Excel copy written to: {args.excel_out}")
 
 
 if __name__ == "__main__":
@@ -7,12 +7,12 @@ time, CPU usage, memory consumption, and computational throughput.
 
 Input Files
 -----------
-- results_summary.csv: Aggregated statistics per language and size
-  Columns: run_id;language;size;runs;avg_time_ms;min_time_ms;max_time_ms;cpu_pct_avg;peak_mib
-
 - results_raw.csv: Per-run raw measurements
   Columns: run_id;language;size;run_idx;time_ms;cpu_pct;peak_mib
 
+Per-size summary statistics (mean, min, max) are computed in-process from
+the raw data, with the same grouping as aggregate_results.py.
+
 Output Files
 ------------
 PNG figures saved to ./figs/ directory:
@@ -26,9 +26,11 @@ PNG figures saved to ./figs/ directory:
 
 Notes
 -----
-- Handles semicolon-separated CSVs with comma decimal separators
+- Expects a semicolon-separated CSV with dot decimal separators
 - Uses matplotlib for all visualizations (no seaborn dependency)
-- Language colors: Python=blue, Java=orange, C=purple
+- Language colors: Python(-naive)=blue, Python-BLAS=green, Python-numba=teal,
+  Python-blocked=olive, Python-cy=brown, Python-avx2=red, Java=orange,
+  C=purple
 """
 
 import os
@@ -39,128 +41,82 @@ import matplotlib.pyplot as plt
 
 # ==================== Configuration ====================
 
-# Input file paths
-SUMMARY_PATH = "results_summary.csv"
+# Input file path
 RAW_PATH = "results_raw.csv"
 
 # Output directory for figures
 OUT_DIR = "figs"
 
 # Color scheme for each language
+# ("Python" is the label used by result files recorded before the Python
+# harness split into separate implementations)
 COLORS = {
     "Python": "blue",
+    "Python-naive": "blue",
+    "Python-BLAS": "green",
+    "Python-numba": "teal",
+    "Python-blocked": "olive",
+    "Python-cy": "brown",
+    "Python-avx2": "red",
     "Java": "orange",
     "C": "purple",
 }
 
 # Consistent ordering of languages across all plots
-LANG_ORDER = ["Python", "Java", "C"]
+LANG_ORDER = ["Python", "Python-naive", "Python-BLAS", "Python-numba", "Python-blocked",
+              "Python-cy", "Python-avx2", "Java", "C"]
 
 # ==================== Utility Functions ====================
 
 
-def _to_num(x):
-    """
-    Convert a possibly locale-formatted string/number to float.
-    
-    Handles various numeric formats including:
-    - European format: '1.234,56' (dot thousands, comma decimal)
-    - US format: '1,234.56' (comma thousands, dot decimal)
-    - Simple format: '1234.56' or '1234'
-    
-    Args:
-        x: String, number, or NaN-like value to convert
-    
-    Returns:
-        Float value, or np.nan if conversion fails
-    
-    Examples:
-        >>> _to_num('1.234,56')
-        1234.56
-        >>> _to_num('1234.56')
-        1234.56
-        >>> _to_num('nan')
-        nan
-    """
-    s = str(x).strip()
-    
-    # Handle empty or NaN strings
-    if s == "" or s.lower() == "nan":
-        return np.nan
-    
-    # If both comma and dot present, assume European format
-    if "," in s and "." in s:
-        # Remove thousands separator (dot), replace decimal separator (comma)
-        s = s.replace(".", "").replace(",", ".")
-    else:
-        # Otherwise, replace comma with dot for decimal
-        s = s.replace(",", ".")
-    
-    try:
-        return float(s)
-    except Exception:
-        return np.nan
-
-
-def load_summary(path=SUMMARY_PATH):
+def load_raw(path=RAW_PATH):
     """
-    Load and sanitize the summary CSV file.
+    Load and sanitize the raw per-run CSV file.
     
-    Reads the aggregated benchmark summary, converts all numeric columns
-    to appropriate types, and filters to include only expected languages.
+    Reads the raw benchmark data (dot decimal separator, as written by the
+    benchmark harnesses) and filters to include only expected languages.
     
     Args:
-        path: Path to the summary CSV file
+        path: Path to the raw CSV file
     
     Returns:
-        DataFrame with sanitized numeric columns and categorical language column
+        DataFrame with numeric columns and categorical language column
     """
-    df = pd.read_csv(path, sep=";", dtype=str)
-    
-    # Convert integer columns
-    for col in ["size", "runs"]:
-        df[col] = df[col].apply(_to_num).astype("Int64")
-    
-    # Convert float columns
-    num_cols = ["avg_time_ms", "min_time_ms", "max_time_ms", "cpu_pct_avg", "peak_mib"]
-    for col in num_cols:
-        df[col] = df[col].apply(_to_num)
+    df = pd.read_csv(path, sep=";", decimal=".", dtype={"run_id": str, "language": str})
     
     # Filter to expected languages and create ordered categorical
     df = df[df["language"].isin(LANG_ORDER)].copy()
     df["language"] = pd.Categorical(df["language"], categories=LANG_ORDER, ordered=True)
     
-    return df.sort_values(["language", "size"])
+    return df.sort_values(["language", "size", "run_idx"])
 
 
-def load_raw(path=RAW_PATH):
+def summarize(df_raw):
     """
-    Load and sanitize the raw per-run CSV file.
+    Aggregate raw per-run measurements into per-size summary statistics.
     
-    Reads the raw benchmark data, converts all numeric columns to appropriate
-    types, and filters to include only expected languages.
+    Computes the same statistics as aggregate_results.py, directly from the
+    numeric raw data, so no locale-formatted summary file has to be parsed.
     
     Args:
-        path: Path to the raw CSV file
+        df_raw: Raw DataFrame as returned by load_raw
     
     Returns:
-        DataFrame with sanitized numeric columns and categorical language column
+        DataFrame with one row per (run_id, language, size) and columns
+        runs, avg_time_ms, min_time_ms, max_time_ms, cpu_pct_avg, peak_mib
     """
-    df = pd.read_csv(path, sep=";", dtype=str)
-    
-    # Convert integer columns
-    for col in ["size", "run_idx"]:
-        df[col] = df[col].apply(_to_num).astype("Int64")
+    g = df_raw.groupby(["run_id", "language", "size"], as_index=False, observed=True)
     
-    # Convert float columns
-    for col in ["time_ms", "cpu_pct", "peak_mib"]:
-        df[col] = df[col].apply(_to_num)
+    summary = g.agg(
+        runs=("run_idx", "count"),
+        avg_time_ms=("time_ms", "mean"),
+        min_time_ms=("time_ms", "min"),
+        max_time_ms=("time_ms", "max"),
+        cpu_pct_avg=("cpu_pct", "mean"),
+        peak_mib=("peak_mib", "max"),
+    )
     
-    # Filter to expected languages and create ordered categorical
-    df = df[df["language"].isin(LANG_ORDER)].copy()
-    df["language"] = pd.Categorical(df["language"], categories=LANG_ORDER, ordered=True)
-    
-    return df.sort_values(["language", "size", "run_idx"])
+    return summary.sort_values(["language", "size"])
 
 
 def ensure_outdir():
@@ -170,27 +126,27 @@ def ensure_outdir():
     os.makedirs(OUT_DIR, exist_ok=True)
 
 
-def savefig(name):
+def savefig(fig, name):
     """
-    Save current matplotlib figure to output directory.
+    Save a matplotlib figure to output directory.
     
     Applies tight layout and saves with high DPI for quality output.
-    Closes the figure after saving to free memory.
+    The figure is left open so the caller can reuse it for the next chart.
     
     Args:
+        fig: Figure to save
         name: Filename for the output PNG (e.g., "time_vs_size.png")
     """
     path = os.path.join(OUT_DIR, name)
-    plt.tight_layout()
-    plt.savefig(path, dpi=200)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(path, dpi=200)
     print(f"  Saved: {name}")
 
 
 # ==================== Plot Functions ====================
 
 
-def plot_time_vs_size(df_sum):
+def plot_time_vs_size(df_sum, ax):
     """
     Plot average execution time vs matrix size with error bars.
     
@@ -199,9 +155,8 @@ def plot_time_vs_size(df_sum):
     
     Args:
         df_sum: Summary DataFrame with avg/min/max time columns
+        ax: Axes to draw on (cleared by the caller)
     """
-    plt.figure(figsize=(7, 4.5))
-    
     for lang in LANG_ORDER:
         d = df_sum[df_sum["language"] == lang]
         if d.empty:
@@ -218,20 +173,20 @@ def plot_time_vs_size(df_sum):
         ])
         
         # Plot with error bars
-        plt.errorbar(
+        ax.errorbar(
             x, y, yerr=yerr, 
             fmt="o-", capsize=3, 
             label=lang, color=COLORS[lang]
         )
     
-    plt.title("Execution Time vs Matrix Size")
-    plt.xlabel("Matrix size (n × n)")
-    plt.ylabel("Time (ms)")
-    plt.legend()
-    savefig("time_vs_size.png")
+    ax.set_title("Execution Time vs Matrix Size")
+    ax.set_xlabel("Matrix size (n × n)")
+    ax.set_ylabel("Time (ms)")
+    ax.legend()
+    savefig(ax.figure, "time_vs_size.png")
 
 
-def plot_time_vs_size_loglog(df_sum):
+def plot_time_vs_size_loglog(df_sum, ax):
     """
     Plot execution time vs size on log-log axes.
     
@@ -240,9 +195,8 @@ def plot_time_vs_size_loglog(df_sum):
     
     Args:
         df_sum: Summary DataFrame with avg_time_ms column
+        ax: Axes to draw on (cleared by the caller)
     """
-    plt.figure(figsize=(7, 4.5))
-    
     for lang in LANG_ORDER:
         d = df_sum[df_sum["language"] == lang]
         if d.empty:
@@ -250,18 +204,18 @@ def plot_time_vs_size_loglog(df_sum):
         
         x = d["size"].astype(int).values
         y = d["avg_time_ms"].values
-        plt.plot(x, y, "o-", label=lang, color=COLORS[lang])
+        ax.plot(x, y, "o-", label=lang, color=COLORS[lang])
     
-    plt.xscale("log")
-    plt.yscale("log")
-    plt.title("Execution Time vs Size (log–log)")
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel("Time (ms)")
-    plt.legend()
-    savefig("time_vs_size_loglog.png")
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_title("Execution Time vs Size (log–log)")
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel("Time (ms)")
+    ax.legend()
+    savefig(ax.figure, "time_vs_size_loglog.png")
 
 
-def plot_speedup_vs_fastest(df_sum):
+def plot_speedup_vs_fastest(df_sum, ax):
     """
     Plot relative speedup compared to the fastest implementation per size.
     
@@ -270,43 +224,30 @@ def plot_speedup_vs_fastest(df_sum):
     
     Args:
         df_sum: Summary DataFrame with avg_time_ms column
+        ax: Axes to draw on (cleared by the caller)
     """
-    sizes = sorted(df_sum["size"].dropna().astype(int).unique())
-    
-    plt.figure(figsize=(7, 4.5))
+    # Speedup of every row against the fastest time at the same size
+    # (higher is better)
+    speedup = df_sum.groupby("size")["avg_time_ms"].transform("min") / df_sum["avg_time_ms"]
     
     for lang in LANG_ORDER:
-        speedups = []
-        
-        # Calculate speedup for each matrix size
-        for n in sizes:
-            d = df_sum[df_sum["size"] == n]
-            if d.empty:
-                speedups.append(np.nan)
-                continue
-            
-            # Find fastest time for this size
-            tmin = d["avg_time_ms"].min()
-            
-            # Get this language's time
-            t_lang = d[d["language"] == lang]["avg_time_ms"]
-            
-            # Calculate speedup (higher is better)
-            if not t_lang.empty:
-                speedups.append(float(tmin) / float(t_lang.iloc[0]))
-            else:
-                speedups.append(np.nan)
+        mask = df_sum["language"] == lang
+        if not mask.any():
+            continue
         
-        plt.plot(sizes, speedups, "o-", label=lang, color=COLORS[lang])
+        ax.plot(
+            df_sum.loc[mask, "size"].astype(int), speedup[mask], 
+            "o-", label=lang, color=COLORS[lang]
+        )
     
-    plt.title("Speedup vs Fastest (per size)")
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel("Speedup (× fastest)")
-    plt.legend()
-    savefig("speedup_vs_fastest.png")
+    ax.set_title("Speedup vs Fastest (per size)")
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel("Speedup (× fastest)")
+    ax.legend()
+    savefig(ax.figure, "speedup_vs_fastest.png")
 
 
-def plot_cpu_vs_size(df_sum):
+def plot_cpu_vs_size(df_sum, ax):
     """
     Plot average CPU usage percentage vs matrix size.
     
@@ -315,27 +256,26 @@ def plot_cpu_vs_size(df_sum):
     
     Args:
         df_sum: Summary DataFrame with cpu_pct_avg column
+        ax: Axes to draw on (cleared by the caller)
     """
-    plt.figure(figsize=(7, 4.5))
-    
     for lang in LANG_ORDER:
         d = df_sum[df_sum["language"] == lang]
         if d.empty:
             continue
         
-        plt.plot(
+        ax.plot(
             d["size"].astype(int), d["cpu_pct_avg"], 
             "o-", label=lang, color=COLORS[lang]
         )
     
-    plt.title("Average CPU Usage vs Matrix Size")
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel("CPU usage (%)")
-    plt.legend()
-    savefig("cpu_vs_size.png")
+    ax.set_title("Average CPU Usage vs Matrix Size")
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel("CPU usage (%)")
+    ax.legend()
+    savefig(ax.figure, "cpu_vs_size.png")
 
 
-def plot_mem_vs_size(df_sum):
+def plot_mem_vs_size(df_sum, ax):
     """
     Plot peak memory consumption vs matrix size.
     
@@ -344,24 +284,23 @@ def plot_mem_vs_size(df_sum):
     
     Args:
         df_sum: Summary DataFrame with peak_mib column
+        ax: Axes to draw on (cleared by the caller)
     """
-    plt.figure(figsize=(7, 4.5))
-    
     for lang in LANG_ORDER:
         d = df_sum[df_sum["language"] == lang]
         if d.empty:
             continue
         
-        plt.plot(
+        ax.plot(
             d["size"].astype(int), d["peak_mib"], 
             "o-", label=lang, color=COLORS[lang]
         )
     
-    plt.title("Peak Memory vs Matrix Size")
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel("Peak memory (MiB)")
-    plt.legend()
-    savefig("mem_vs_size.png")
+    ax.set_title("Peak Memory vs Matrix Size")
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel("Peak memory (MiB)")
+    ax.legend()
+    savefig(ax.figure, "mem_vs_size.png")
 
 
 def plot_boxplots_time_by_size(df_raw):
@@ -378,40 +317,48 @@ def plot_boxplots_time_by_size(df_raw):
     if not sizes:
         return
     
+    # Partition the per-run times by (size, language) once, up front
+    by_size_lang = {
+        key: times.dropna().values
+        for key, times in df_raw.groupby(["size", "language"], observed=True)["time_ms"]
+    }
+    
+    # Only show languages that have data, so boxes and labels don't crowd
+    present = {lang for _, lang in by_size_lang}
+    langs = [lang for lang in LANG_ORDER if lang in present]
+    
     # Calculate subplot grid dimensions
     cols = min(3, len(sizes))
     rows = math.ceil(len(sizes) / cols)
     
-    plt.figure(figsize=(6 * cols, 4 * rows))
+    # The grid layout needs its own figure rather than the shared axes
+    fig = plt.figure(figsize=(6 * cols, 4 * rows))
     
     # Create one subplot per matrix size
     for idx, n in enumerate(sizes, start=1):
-        ax = plt.subplot(rows, cols, idx)
-        d = df_raw[df_raw["size"] == n]
+        ax = fig.add_subplot(rows, cols, idx)
         
         # Collect data for each language
-        data = [
-            d[d["language"] == lang]["time_ms"].dropna().values 
-            for lang in LANG_ORDER
-        ]
+        data = [by_size_lang.get((n, lang), np.array([])) for lang in langs]
         
         # Create boxplot
-        ax.boxplot(data, labels=LANG_ORDER, showmeans=True)
+        ax.boxplot(data, labels=langs, showmeans=True)
         
         # Color x-axis labels to match language colors
-        for ticklabel, lang in zip(ax.get_xticklabels(), LANG_ORDER):
+        for ticklabel, lang in zip(ax.get_xticklabels(), langs):
             ticklabel.set_color(COLORS[lang])
         
         ax.set_title(f"Per-run Time at n={n}")
         ax.set_xlabel("Language")
         ax.set_ylabel("Time (ms)")
     
-    plt.suptitle("Time Dispersion by Size and Language", y=0.99)
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
-    savefig("boxplots_time_by_size.png")
+    fig.suptitle("Time Dispersion by Size and Language", y=0.99)
+    fig.tight_layout(rect=[0, 0, 1, 0.97])
+    savefig(fig, "boxplots_time_by_size.png")
+    plt.close(fig)
 
 
-def plot_efficiency_gflops(df_sum):
+def plot_efficiency_gflops(df_sum, ax):
     """
     Plot computational throughput in GFLOP/s vs matrix size.
     
@@ -422,9 +369,8 @@ def plot_efficiency_gflops(df_sum):
     
     Args:
         df_sum: Summary DataFrame with avg_time_ms column
+        ax: Axes to draw on (cleared by the caller)
     """
-    plt.figure(figsize=(7, 4.5))
-    
     for lang in LANG_ORDER:
         d = df_sum[df_sum["language"] == lang]
         if d.empty:
@@ -437,13 +383,13 @@ def plot_efficiency_gflops(df_sum):
         # Calculate GFLOP/s: 2n³ operations / (time * 10⁹)
         gflops = (2.0 * (n.astype(float) ** 3)) / (t_s * 1e9)
         
-        plt.plot(n, gflops, "o-", label=lang, color=COLORS[lang])
+        ax.plot(n, gflops, "o-", label=lang, color=COLORS[lang])
     
-    plt.title("Throughput (GFLOP/s) vs Matrix Size")
-    plt.xlabel("Matrix size (n)")
-    plt.ylabel("GFLOP/s")
-    plt.legend()
-    savefig("efficiency_gflops.png")
+    ax.set_title("Throughput (GFLOP/s) vs Matrix Size")
+    ax.set_xlabel("Matrix size (n)")
+    ax.set_ylabel("GFLOP/s")
+    ax.legend()
+    savefig(ax.figure, "efficiency_gflops.png")
 
 
 # ==================== Main Entry Point ====================
@@ -456,18 +402,25 @@ if __name__ == "__main__":
     ensure_outdir()
     
     # Load data
-    print(f"Loading data from {SUMMARY_PATH} and {RAW_PATH}...")
-    summary = load_summary(SUMMARY_PATH)
+    print(f"Loading data from {RAW_PATH}...")
     raw = load_raw(RAW_PATH)
+    summary = summarize(raw)
     
-    # Generate all plots
+    # Generate all plots, reusing one figure for the single-axes charts
     print("Creating plots...")
-    plot_time_vs_size(summary)
-    plot_time_vs_size_loglog(summary)
-    plot_speedup_vs_fastest(summary)
-    plot_cpu_vs_size(summary)
-    plot_mem_vs_size(summary)
+    fig, ax = plt.subplots(figsize=(7, 4.5))
+    for plotter in [
+        plot_time_vs_size,
+        plot_time_vs_size_loglog,
+        plot_speedup_vs_fastest,
+        plot_cpu_vs_size,
+        plot_mem_vs_size,
+        plot_efficiency_gflops,
+    ]:
+        ax.clear()
+        plotter(summary, ax)
+    plt.close(fig)
+    
     plot_boxplots_time_by_size(raw)
-    plot_efficiency_gflops(summary)
     
     print(f"\n✓ All figures saved to: {OUT_DIR}/")
\ No newline at end of file